@@ -1,4 +1,6 @@
-from flask import Flask, render_template, request, redirect
+import secrets
+
+from flask import Flask, render_template, request, redirect, stream_template
 
 app = Flask(__name__)
 app.config["TEMPLATES_AUTO_RELOAD"] = True  
@@ -21,17 +23,32 @@ events = [
         'featured': True
     }
 ]
+
+# Índice de eventos por slug para búsquedas O(1)
+events_by_slug = {e['slug']: e for e in events}
  
 # Categorías de eventos
-categories = ['Tecnología', 'Académico', 'Cultural', 'Deportivo', 'Social']
+categories = ('Tecnología', 'Académico', 'Cultural', 'Deportivo', 'Social')
+
+# Eventos por página en el listado
+PER_PAGE = 20
 
 @app.route("/")
 def index():
-    return render_template("index.html", events=events)
+    page = max(request.args.get("page", 1, type=int), 1)
+    start = (page - 1) * PER_PAGE
+    page_events = events[start:start + PER_PAGE]
+    return stream_template(
+        "index.html",
+        events=page_events,
+        page=page,
+        has_prev=page > 1,
+        has_next=start + PER_PAGE < len(events),
+    )
 
 @app.route("/event/<slug>")
 def event_detail(slug):
-    event = next((e for e in events if e['slug'] == slug), None)
+    event = events_by_slug.get(slug)
     if event:
         return render_template("event_detail.html", event=event)
     return "Evento no encontrado", 404
@@ -41,10 +58,14 @@ def add_event():
     if request.method == "POST":
         title = request.form["title"]
         description = request.form["description"]
-        events.append({
+        base_slug = title.lower().replace(" ", "-")
+        slug = base_slug
+        while slug in events_by_slug:
+            slug = f"{base_slug}-{secrets.token_hex(2)}"
+        new_event = {
             "id": len(events) + 1,
             "title": title,
-            "slug": title.lower().replace(" ", "-"),
+            "slug": slug,
             "description": description,
             "date": request.form["date"],
             "time": request.form["time"],
@@ -53,14 +74,16 @@ def add_event():
             "max_attendees": int(request.form["max_attendees"]),
             "attendees": [],
             "featured": True
-        })
+        }
+        events.append(new_event)
+        events_by_slug[new_event["slug"]] = new_event
         return redirect("/") 
     return render_template("add.html", categories=categories)
 
 #formulario para registrar evento
 @app.route("/event/<slug>/register/", methods=["GET", "POST"])
 def register_event(slug):
-    event = next((e for e in events if e['slug'] == slug), None)
+    event = events_by_slug.get(slug)
     if request.method == "POST":
         if event:
             name = request.form["name"]